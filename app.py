@@ -10,6 +10,9 @@ Demo-optimized version:
 Purpose: Demonstrate prescriptive analytics for workforce planning.
 """
 
+import io
+
+import altair as alt
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -43,13 +46,28 @@ st.markdown(
 # DATA SOURCE (LOCKED)
 # --------------------------------------------------
 DATA_PATH = "data/cafe_hourly_demand_3months.csv"
+PREVIEW_ROWS = 200
 
 @st.cache_data(show_spinner=False)
 def load_data(path: str) -> pd.DataFrame:
-    df = pd.read_csv(path)
-    df["date"] = pd.to_datetime(df["date"])
-    df["hour"] = pd.to_numeric(df["hour"])
-    df["time_bucket"] = df["date"] + pd.to_timedelta(df["hour"], unit="h")
+    df = pd.read_csv(
+        path,
+        engine="pyarrow",
+        parse_dates=["date"]
+    )
+    # Downcast only after a range check; out-of-range values would wrap
+    for col, dtype in (("hour", np.int8), ("demand", np.int16)):
+        info = np.iinfo(dtype)
+        if df[col].min() < info.min or df[col].max() > info.max:
+            raise ValueError(
+                f"Column `{col}` has values outside the {info.dtype} range."
+            )
+        df[col] = df[col].astype(dtype)
+    df["date"] = df["date"].astype("datetime64[s]")
+    df["time_bucket"] = (
+        df["date"].to_numpy().astype("datetime64[h]")
+        + df["hour"].to_numpy(dtype=np.int64).astype("timedelta64[h]")
+    )
     return df.sort_values("time_bucket").reset_index(drop=True)
 
 try:
@@ -60,6 +78,68 @@ except FileNotFoundError:
         "Ensure the file exists in the GitHub repository."
     )
     st.stop()
+except ValueError as e:
+    st.error(f"Dataset at `{DATA_PATH}` is invalid: {e}")
+    st.stop()
+
+@st.cache_data(show_spinner=False)
+def compute_required(
+    demand: np.ndarray,
+    productivity: float,
+    service_buffer: float
+) -> np.ndarray:
+    return np.ceil(
+        (demand / productivity) * service_buffer
+    ).astype(np.int32)
+
+@st.cache_data(show_spinner=False)
+def run_optimizer(
+    required_staff: np.ndarray,
+    hourly_wage: np.ndarray,
+    max_staff,
+    overstaff_penalty: float
+):
+    # Arrays are hashed by content, so reruns with unchanged inputs are free
+    return optimize_staffing(
+        required_staff=required_staff,
+        hourly_wage=hourly_wage,
+        max_staff=max_staff,
+        overstaff_penalty=overstaff_penalty
+    )
+
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False)
+    return buf.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_charts(plan: pd.DataFrame):
+    # Keyed on the plotted columns, so any change in data invalidates it
+    staffing_chart = (
+        alt.Chart(plan[["time_bucket", "required_staff", "planned_staff"]])
+        .transform_fold(
+            ["required_staff", "planned_staff"],
+            as_=["series", "staff"]
+        )
+        .mark_line()
+        .encode(
+            x=alt.X("time_bucket:T", title=None),
+            y=alt.Y("staff:Q", title="Staff"),
+            color=alt.Color("series:N", title=None)
+        )
+        .properties(height=400)
+    )
+    cost_chart = (
+        alt.Chart(plan[["time_bucket", "hourly_cost"]])
+        .mark_line()
+        .encode(
+            x=alt.X("time_bucket:T", title=None),
+            y=alt.Y("hourly_cost:Q", title="Hourly cost ($)")
+        )
+        .properties(height=300)
+    )
+    return staffing_chart, cost_chart
 
 st.info(f"Using bundled staffing dataset ({len(df):,} hourly records)")
 
@@ -109,9 +189,11 @@ run_button = st.sidebar.button(
 # --------------------------------------------------
 # PREPARE DEMAND
 # --------------------------------------------------
-df["required_staff"] = np.ceil(
-    (df["demand"] / productivity) * service_buffer
-).astype(int)
+df["required_staff"] = compute_required(
+    df["demand"].to_numpy(),
+    productivity,
+    service_buffer
+)
 
 # --------------------------------------------------
 # DATA PREVIEW
@@ -133,16 +215,16 @@ if run_button:
 
     with st.spinner("Solving staffing optimization model..."):
 
-        staff_plan, total_cost = optimize_staffing(
-            required_staff=df["required_staff"].values,
-            hourly_wage=df["hourly_wage"].values,
-            max_staff=None if max_staff == 0 else int(max_staff),
-            overstaff_penalty=overstaff_penalty
+        staff_plan, total_cost = run_optimizer(
+            df["required_staff"].to_numpy(),
+            df["hourly_wage"].to_numpy(),
+            None if max_staff == 0 else int(max_staff),
+            overstaff_penalty
         )
 
     df["planned_staff"] = staff_plan
-    df["gap"] = df["planned_staff"] - df["required_staff"]
-    df["hourly_cost"] = df["planned_staff"] * df["hourly_wage"]
+    df["gap"] = staff_plan - df["required_staff"].to_numpy()
+    df["hourly_cost"] = staff_plan * df["hourly_wage"].to_numpy()
 
     # --------------------------------------------------
     # SUMMARY METRICS
@@ -151,25 +233,28 @@ if run_button:
 
     c1, c2, c3 = st.columns(3)
     c1.metric("Total Labor Cost", f"${total_cost:,.2f}")
-    c2.metric("Avg Staff / Hour", f"{df['planned_staff'].mean():.2f}")
-    c3.metric("Peak Staff Required", int(df["planned_staff"].max()))
+    c2.metric("Avg Staff / Hour", f"{staff_plan.mean():.2f}")
+    c3.metric("Peak Staff Required", int(staff_plan.max()))
 
     # --------------------------------------------------
     # VISUALS
     # --------------------------------------------------
-    st.subheader("📈 Demand vs Staffing")
-
-    chart_df = df.set_index("time_bucket")[
-        ["required_staff", "planned_staff"]
-    ]
+    staffing_chart, cost_chart = build_charts(
+        df[
+            [
+                "time_bucket",
+                "required_staff",
+                "planned_staff",
+                "hourly_cost"
+            ]
+        ]
+    )
 
-    st.line_chart(chart_df, height=400)
+    st.subheader("📈 Demand vs Staffing")
+    st.altair_chart(staffing_chart, width="stretch")
 
     st.subheader("💰 Hourly Labor Cost")
-    st.line_chart(
-        df.set_index("time_bucket")["hourly_cost"],
-        height=300
-    )
+    st.altair_chart(cost_chart, width="stretch")
 
     # --------------------------------------------------
     # DETAILED OUTPUT
@@ -187,18 +272,20 @@ if run_button:
                 "gap",
                 "hourly_cost"
             ]
-        ],
+        ].head(PREVIEW_ROWS),
         use_container_width=True
     )
+    st.caption(
+        f"Showing the first {min(PREVIEW_ROWS, len(df)):,} of {len(df):,} "
+        "hours. Download the CSV below for the full plan."
+    )
 
     # --------------------------------------------------
     # DOWNLOAD
     # --------------------------------------------------
-    csv = df.to_csv(index=False).encode("utf-8")
-
     st.download_button(
         "Download staffing_plan_output.csv",
-        data=csv,
+        data=to_csv_bytes(df),
         file_name="staffing_plan_output.csv",
         mime="text/csv"
     )
@@ -209,5 +296,5 @@ if run_button:
 st.markdown("---")
 st.caption(
     "Built for ISOM 839 – Prescriptive Analytics | "
-    "Staffing Optimization | SciPy | Demo Mode"
+    "Staffing Optimization | NumPy | Demo Mode"
 )
@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.optimize import linprog
 
 def optimize_staffing(
     required_staff,
@@ -8,7 +7,7 @@ def optimize_staffing(
     overstaff_penalty=0.0
 ):
     """
-    Solves a staffing optimization problem using SciPy.
+    Solves a staffing optimization problem in closed form.
 
     Objective:
         Minimize total labor cost (with optional overstaffing penalty)
@@ -16,7 +15,11 @@ def optimize_staffing(
     Constraints:
         staff[t] >= required_staff[t]
         staff[t] <= max_staff (optional)
-        staff[t] >= 0 and integer (approximated via rounding)
+        staff[t] >= 0 and integer
+
+    Every hour is independent, so as long as no staff-hour has a negative
+    cost the optimum is simply staff[t] = max(ceil(required_staff[t]), 0).
+    No LP solver is needed.
 
     Parameters:
         required_staff (array-like): Required staff per hour
@@ -29,41 +32,36 @@ def optimize_staffing(
         total_cost (float): Total labor cost
     """
 
-    required_staff = np.array(required_staff, dtype=float)
-    hourly_wage = np.array(hourly_wage, dtype=float)
-    n = len(required_staff)
-
-    # Cost coefficients
-    c = hourly_wage + overstaff_penalty
-
-    # Constraints: -staff <= -required_staff
-    A_ub = -np.eye(n)
-    b_ub = -required_staff
+    required_staff = np.ascontiguousarray(required_staff, dtype=np.float64)
+    hourly_wage = np.ascontiguousarray(hourly_wage, dtype=np.float64)
 
-    # Bounds
-    bounds = []
-    for _ in range(n):
-        if max_staff is not None:
-            bounds.append((0, max_staff))
-        else:
-            bounds.append((0, None))
+    # NaN/inf would otherwise cast to a garbage integer plan
+    if (
+        not np.all(np.isfinite(required_staff))
+        or not np.all(np.isfinite(hourly_wage))
+    ):
+        raise ValueError(
+            "required_staff and hourly_wage must contain only finite values."
+        )
 
-    # Solve LP
-    result = linprog(
-        c=c,
-        A_ub=A_ub,
-        b_ub=b_ub,
-        bounds=bounds,
-        method="highs"
-    )
+    # Negative cost makes the plan unbounded or pinned to the cap
+    if np.any(hourly_wage + overstaff_penalty < 0):
+        raise RuntimeError(
+            "Optimization failed: hourly_wage + overstaff_penalty must be "
+            "non-negative in every hour."
+        )
 
-    if not result.success:
-        raise RuntimeError("Optimization failed: " + result.message)
+    # Coverage and capacity cannot both be met
+    if max_staff is not None and np.any(required_staff > max_staff):
+        raise RuntimeError(
+            "Optimization failed: required staff exceeds max_staff "
+            "in at least one hour."
+        )
 
-    # Conservative rounding to preserve feasibility
-    staff_plan = np.ceil(result.x).astype(int)
+    # Cheapest feasible plan: staff exactly to requirement
+    staff_plan = np.maximum(np.ceil(required_staff), 0).astype(np.int64)
 
     # Cost calculation
-    total_cost = np.sum(staff_plan * hourly_wage)
+    total_cost = float(staff_plan @ hourly_wage)
 
     return staff_plan, total_cost
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from optimizer_scipy import optimize_staffing
+
+
+def test_staffs_to_requirement():
+    staff_plan, total_cost = optimize_staffing([1, 2.2, 3], [18, 18, 20])
+
+    np.testing.assert_array_equal(staff_plan, [1, 3, 3])
+    assert total_cost == pytest.approx(132.0)
+
+
+def test_negative_requirement_clamped_to_zero():
+    staff_plan, total_cost = optimize_staffing([-1, 2], [18, 18])
+
+    np.testing.assert_array_equal(staff_plan, [0, 2])
+    assert total_cost == pytest.approx(36.0)
+
+
+def test_zero_cost_hour_staffs_to_requirement():
+    staff_plan, total_cost = optimize_staffing([1, 2], [0, 18])
+
+    np.testing.assert_array_equal(staff_plan, [1, 2])
+    assert total_cost == pytest.approx(36.0)
+
+
+def test_max_staff_below_requirement_raises():
+    with pytest.raises(RuntimeError, match="max_staff"):
+        optimize_staffing([1, 5], [18, 18], max_staff=4)
+
+
+def test_max_staff_at_requirement_is_feasible():
+    staff_plan, _ = optimize_staffing([1, 4], [18, 18], max_staff=4)
+
+    np.testing.assert_array_equal(staff_plan, [1, 4])
+
+
+@pytest.mark.parametrize(
+    "hourly_wage, overstaff_penalty",
+    [([-5, 18], 0.0), ([10, 18], -11.0)],
+)
+def test_negative_cost_raises(hourly_wage, overstaff_penalty):
+    with pytest.raises(RuntimeError, match="non-negative"):
+        optimize_staffing([1, 2], hourly_wage, overstaff_penalty=overstaff_penalty)
+
+
+@pytest.mark.parametrize(
+    "required_staff, hourly_wage",
+    [([np.nan, 2], [18, 18]), ([1, 2], [np.inf, 18])],
+)
+def test_non_finite_input_raises(required_staff, hourly_wage):
+    with pytest.raises(ValueError, match="finite"):
+        optimize_staffing(required_staff, hourly_wage)